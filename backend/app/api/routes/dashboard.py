@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from ...database import get_db
 from ...models import Strategy, BacktestRun, PaperTradingSession, User
@@ -17,36 +17,28 @@ async def get_dashboard_stats(
     """Get dashboard statistics."""
     owner_id = current_user.id
 
-    total_strategies = (
-        db.query(func.count(Strategy.id))
-        .filter(Strategy.owner_id == owner_id)
-        .scalar()
-        or 0
-    )
-
-    active_backtests = (
-        db.query(func.count(BacktestRun.id))
-        .filter(BacktestRun.owner_id == owner_id)
-        .scalar()
-        or 0
-    )
-
-    paper_trading_sessions = (
-        db.query(func.count(PaperTradingSession.id))
-        .filter(
+    # All counters in one round trip, as scalar subqueries of a single SELECT
+    counts = db.query(
+        select(func.count(Strategy.id))
+        .where(Strategy.owner_id == owner_id)
+        .scalar_subquery()
+        .label("total_strategies"),
+        select(func.count(BacktestRun.id))
+        .where(BacktestRun.owner_id == owner_id)
+        .scalar_subquery()
+        .label("active_backtests"),
+        select(func.count(PaperTradingSession.id))
+        .where(
             PaperTradingSession.owner_id == owner_id,
             PaperTradingSession.is_active == True,
         )
-        .scalar()
-        or 0
-    )
-
-    total_trades = (
-        db.query(func.sum(PaperTradingSession.total_trades))
-        .filter(PaperTradingSession.owner_id == owner_id)
-        .scalar()
-        or 0
-    )
+        .scalar_subquery()
+        .label("paper_trading_sessions"),
+        select(func.sum(PaperTradingSession.total_trades))
+        .where(PaperTradingSession.owner_id == owner_id)
+        .scalar_subquery()
+        .label("total_trades"),
+    ).one()
 
     portfolio_session = (
         db.query(PaperTradingSession)
@@ -61,10 +53,10 @@ async def get_dashboard_stats(
     daily_return = portfolio_session.total_return_pct if portfolio_session else 0.0
 
     return {
-        "total_strategies": total_strategies,
-        "active_backtests": active_backtests,
-        "paper_trading_sessions": paper_trading_sessions,
-        "total_trades": int(total_trades),
+        "total_strategies": counts.total_strategies or 0,
+        "active_backtests": counts.active_backtests or 0,
+        "paper_trading_sessions": counts.paper_trading_sessions or 0,
+        "total_trades": int(counts.total_trades or 0),
         "portfolio_value": portfolio_value,
         "daily_return": daily_return,
     }
@@ -3,7 +3,6 @@
 import sys
 from pathlib import Path
 
-import yfinance as yf
 from fastapi import APIRouter, HTTPException, Query
 
 # Add project root to path for imports
@@ -26,6 +25,8 @@ async def get_current_price(symbol: str):
         return cached
 
     try:
+        import yfinance as yf
+
         ticker = yf.Ticker(symbol)
         info = ticker.fast_info
         price = getattr(info, "last_price", None)
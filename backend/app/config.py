@@ -26,6 +26,7 @@ class Settings(BaseSettings):
         "dev-only-e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
     )
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
     
     class Config:
         case_sensitive = True
@@ -149,7 +149,7 @@ class BacktestService:
             }
 
         except Exception as e:
-            logger.error(f"Backtest error: {str(e)}", exc_info=True)
+            logger.error("Backtest error: %s", e, exc_info=True)
             db.rollback()
             if settings.DEBUG:
                 return {"error": f"Backtest error: {str(e)[:200]}"}
@@ -203,7 +203,7 @@ class BacktestService:
             }
 
         except Exception as e:
-            logger.error(f"Error fetching backtest results: {str(e)}")
+            logger.error("Error fetching backtest results: %s", e)
             if settings.DEBUG:
                 return {"error": str(e)[:200]}
             return {"error": "Failed to fetch backtest results"}
@@ -88,7 +88,7 @@ class PaperTradingService:
             }
 
         except Exception as e:
-            logger.error(f"Error creating session: {str(e)}")
+            logger.error("Error creating session: %s", e)
             db.rollback()
             if settings.DEBUG:
                 return {"error": str(e)[:200]}
@@ -199,7 +199,7 @@ class PaperTradingService:
             }
 
         except Exception as e:
-            logger.error(f"Error updating session: {str(e)}", exc_info=True)
+            logger.error("Error updating session: %s", e, exc_info=True)
             db.rollback()
             if settings.DEBUG:
                 return {"error": str(e)[:200]}
@@ -255,7 +255,7 @@ class PaperTradingService:
             }
 
         except Exception as e:
-            logger.error(f"Error fetching session: {str(e)}")
+            logger.error("Error fetching session: %s", e)
             if settings.DEBUG:
                 return {"error": str(e)[:200]}
             return {"error": "Failed to fetch session details"}
@@ -289,7 +289,7 @@ class PaperTradingService:
             }
 
         except Exception as e:
-            logger.error(f"Error closing session: {str(e)}")
+            logger.error("Error closing session: %s", e)
             db.rollback()
             if settings.DEBUG:
                 return {"error": str(e)[:200]}
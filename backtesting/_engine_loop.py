@@ -0,0 +1,377 @@
+"""Bar-by-bar trade simulation kernel used by Backtester.
+
+The simulation is a sequential state machine (position, SL/TP, pending
+signal), so it cannot be vectorized. It runs over plain NumPy arrays and is
+compiled with numba when available; otherwise it still avoids per-row pandas
+access, which dominated the cost of the previous DataFrame loop.
+"""
+
+import numpy as np
+
+from utils._njit import njit, prange
+
+# Exit reason codes returned in ``reason``
+EXIT_SL = 0
+EXIT_TP = 1
+EXIT_SIGNAL_REVERSAL = 2
+
+EXIT_REASONS = ("sl", "tp", "signal_reversal")
+
+
+@njit(cache=True)
+def _trade_buffers(size):
+    """Empty trade column arrays (see _simulate) with room for ``size`` trades."""
+    return (
+        np.empty(size, dtype=np.int64),  # entry_idx
+        np.empty(size, dtype=np.int64),  # exit_idx
+        np.empty(size, dtype=np.int8),  # side
+        np.empty(size, dtype=np.float64),  # entry_price
+        np.empty(size, dtype=np.float64),  # exit_price
+        np.empty(size, dtype=np.float64),  # position_size
+        np.empty(size, dtype=np.float64),  # sl_price
+        np.empty(size, dtype=np.float64),  # tp_price
+        np.empty(size, dtype=np.float64),  # pnl
+        np.empty(size, dtype=np.int8),  # reason
+    )
+
+
+@njit(cache=True)
+def _simulate(
+    open_,
+    high,
+    low,
+    close,
+    signal,
+    strength,
+    initial_capital,
+    sl_pct,
+    tp_rr,
+    fee_pct,
+    risk_pct,
+    allow_short,
+    equity_out,
+    trades_out,
+    offset,
+    record,
+):
+    """
+    Simulate trades over a signal series.
+
+    Rules (same as Backtester.backtest):
+    - A signal on candle i is entered at the open of candle i + 1.
+    - If SL and TP are both touched within a candle, the one closer to the
+      open is assumed to hit first.
+    - An opposite signal closes the position at the candle close.
+    - No re-entry on the candle where a position was closed.
+    - Position size follows utils.risk.calculate_position_size_spot, with
+      the risk scaled by the signal strength.
+
+    The equity curve (with unrealized PnL) is written into the caller's
+    preallocated float64 array ``equity_out``, one value per bar. When
+    ``record`` is true, trade k is written at index ``offset + k`` of the
+    ``trades_out`` columns (as built by _trade_buffers); otherwise trades
+    are only counted. ``side`` is 1 for long and -1 for short, ``reason``
+    indexes EXIT_REASONS.
+
+    Returns:
+        (n_trades, final_capital)
+    """
+    (
+        t_entry_idx,
+        t_exit_idx,
+        t_side,
+        t_entry_px,
+        t_exit_px,
+        t_size,
+        t_sl,
+        t_tp,
+        t_pnl,
+        t_reason,
+    ) = trades_out
+    n = close.shape[0]
+    n_trades = 0
+
+    capital = initial_capital
+    in_position = False
+    side = 0
+    entry_price = 0.0
+    entry_idx = 0
+    position_size = 0.0
+    sl_price = 0.0
+    tp_price = 0.0
+
+    # Pending signal from previous candle (for next-candle entry)
+    pending_signal = 0
+    pending_strength = 1.0
+
+    # Loop invariants: SL/TP distance factors and whether fees apply at all
+    sl_long = 1 - sl_pct
+    tp_long = 1 + sl_pct * tp_rr
+    sl_short = 1 + sl_pct
+    tp_short = 1 - sl_pct * tp_rr
+    has_fees = fee_pct != 0.0
+
+    for i in range(n):
+        sig = signal[i]
+        # float() promotes float32 prices to float64 without numba too (NumPy 2
+        # keeps float32 * Python float in float32), matching the compiled kernel
+        open_price = float(open_[i])
+        high_price = float(high[i])
+        low_price = float(low[i])
+        close_price = float(close[i])
+        exited_this_candle = False
+
+        if in_position:
+            exited = False
+            exit_price = 0.0
+            reason = EXIT_SL
+
+            if side == 1:
+                sl_hit = low_price <= sl_price
+                tp_hit = high_price >= tp_price
+            else:
+                sl_hit = high_price >= sl_price
+                tp_hit = low_price <= tp_price
+
+            if sl_hit and tp_hit:
+                # Both could hit -- whichever is closer to open
+                if abs(open_price - sl_price) <= abs(open_price - tp_price):
+                    exit_price = sl_price
+                    reason = EXIT_SL
+                else:
+                    exit_price = tp_price
+                    reason = EXIT_TP
+                exited = True
+            elif sl_hit:
+                exit_price = sl_price
+                reason = EXIT_SL
+                exited = True
+            elif tp_hit:
+                exit_price = tp_price
+                reason = EXIT_TP
+                exited = True
+
+            # Also exit on opposing signal
+            if not exited and sig != 0:
+                if (side == 1 and sig == -1) or (side == -1 and sig == 1):
+                    exit_price = close_price
+                    reason = EXIT_SIGNAL_REVERSAL
+                    exited = True
+
+            if exited:
+                if side == 1:
+                    raw_pnl = (exit_price - entry_price) * position_size
+                else:
+                    raw_pnl = (entry_price - exit_price) * position_size
+
+                # Deduct fees (entry + exit)
+                if has_fees:
+                    fee_cost = (
+                        entry_price * position_size * fee_pct
+                        + exit_price * position_size * fee_pct
+                    )
+                    pnl = raw_pnl - fee_cost
+                else:
+                    pnl = raw_pnl
+                capital += pnl
+
+                if record:
+                    k = offset + n_trades
+                    t_entry_idx[k] = entry_idx
+                    t_exit_idx[k] = i
+                    t_side[k] = side
+                    t_entry_px[k] = entry_price
+                    t_exit_px[k] = exit_price
+                    t_size[k] = position_size
+                    t_sl[k] = sl_price
+                    t_tp[k] = tp_price
+                    t_pnl[k] = pnl
+                    t_reason[k] = reason
+                n_trades += 1
+
+                in_position = False
+                exited_this_candle = True
+
+        # Execute pending entry from previous candle's signal (enter at this candle's open)
+        if not in_position and not exited_this_candle and pending_signal != 0:
+            if pending_signal == -1 and not allow_short:
+                pending_signal = 0
+                pending_strength = 1.0
+            else:
+                entry_price = open_price
+                entry_idx = i
+                side = 1 if pending_signal == 1 else -1
+
+                if side == 1:
+                    sl_price = entry_price * sl_long
+                    tp_price = entry_price * tp_long
+                else:
+                    sl_price = entry_price * sl_short
+                    tp_price = entry_price * tp_short
+
+                # Same sizing as utils.risk.calculate_position_size_spot, inlined
+                # so the compiled kernel does not depend on the utils package
+                risk_amount = capital * (risk_pct * pending_strength)
+                price_diff = abs(entry_price - sl_price)
+                if price_diff == 0:
+                    position_size = 0.0
+                else:
+                    position_size = min(risk_amount / price_diff, capital / entry_price)
+
+                pending_signal = 0
+                pending_strength = 1.0
+
+                in_position = not (position_size <= 0)
+
+        # Store signal for next candle entry (only if not already in position)
+        if not in_position and sig != 0:
+            pending_signal = sig
+            pending_strength = strength[i]
+        elif in_position:
+            pending_signal = 0
+            pending_strength = 1.0
+
+        # Equity curve with unrealized PnL
+        if in_position:
+            if side == 1:
+                unrealized = (close_price - entry_price) * position_size
+            else:
+                unrealized = (entry_price - close_price) * position_size
+            equity_out[i] = capital + unrealized
+        else:
+            equity_out[i] = capital
+
+    return n_trades, capital
+
+
+@njit(cache=True)
+def _walk(
+    open_,
+    high,
+    low,
+    close,
+    signal,
+    strength,
+    initial_capital,
+    sl_pct,
+    tp_rr,
+    fee_pct,
+    risk_pct,
+    allow_short,
+    equity_out,
+):
+    """
+    Run _simulate for a single signal series.
+
+    Returns:
+        (equity_out, entry_idx, exit_idx, side, entry_price, exit_price,
+        position_size, sl_price, tp_price, pnl, reason, n_trades,
+        final_capital). Trade arrays are sized to the number of bars; only
+        the first ``n_trades`` entries are valid.
+    """
+    trades = _trade_buffers(close.shape[0])
+    n_trades, capital = _simulate(
+        open_,
+        high,
+        low,
+        close,
+        signal,
+        strength,
+        initial_capital,
+        sl_pct,
+        tp_rr,
+        fee_pct,
+        risk_pct,
+        allow_short,
+        equity_out,
+        trades,
+        0,
+        True,
+    )
+    return (equity_out,) + trades + (n_trades, capital)
+
+
+@njit(parallel=True, cache=True)
+def _walk_batch(
+    open_,
+    high,
+    low,
+    close,
+    signals,
+    strengths,
+    initial_capital,
+    sl_pct,
+    tp_rr,
+    fee_pct,
+    risk_pct,
+    allow_short,
+):
+    """
+    Run _simulate for every row of ``signals`` over the same price series.
+
+    Each run is sequential, but runs are independent of each other, so they
+    are spread across threads with prange. ``strengths`` has the same shape
+    as ``signals``; the scalar parameters are per-run arrays.
+
+    Trades are stored compacted: a first pass counts each run's trades, a
+    second one writes them into flat columns sized to the total, so memory
+    grows with the number of trades instead of runs x bars.
+
+    Returns:
+        (equity, entry_idx, exit_idx, side, entry_price, exit_price,
+        position_size, sl_price, tp_price, pnl, reason, offsets,
+        final_capital). ``equity`` is (runs x bars); the trades of run r
+        are ``offsets[r]:offsets[r + 1]`` of the flat trade columns.
+    """
+    n_runs, n = signals.shape
+
+    equity = np.empty((n_runs, n), dtype=np.float64)
+    n_trades = np.empty(n_runs, dtype=np.int64)
+    final_capital = np.empty(n_runs, dtype=np.float64)
+
+    no_trades = _trade_buffers(0)
+    for r in prange(n_runs):
+        n_trades[r], final_capital[r] = _simulate(
+            open_,
+            high,
+            low,
+            close,
+            signals[r],
+            strengths[r],
+            initial_capital[r],
+            sl_pct[r],
+            tp_rr[r],
+            fee_pct[r],
+            risk_pct[r],
+            allow_short[r],
+            equity[r],
+            no_trades,
+            0,
+            False,
+        )
+
+    offsets = np.zeros(n_runs + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(n_trades)
+    trades = _trade_buffers(offsets[n_runs])
+
+    for r in prange(n_runs):
+        _simulate(
+            open_,
+            high,
+            low,
+            close,
+            signals[r],
+            strengths[r],
+            initial_capital[r],
+            sl_pct[r],
+            tp_rr[r],
+            fee_pct[r],
+            risk_pct[r],
+            allow_short[r],
+            equity[r],
+            trades,
+            offsets[r],
+            True,
+        )
+
+    return (equity,) + trades + (offsets, final_capital)
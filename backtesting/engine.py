@@ -1,10 +1,48 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Type
+from typing import List, Dict, Any, Optional, Sequence, Type
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
-from utils.risk import calculate_position_size_spot
+from backtesting._engine_loop import EXIT_REASONS, _walk, _walk_batch
+
+
+_PRICE_DTYPES = {"f64": np.float64, "f32": np.float32}
+
+# Monte Carlo simulations evaluated together per vectorized block
+_MONTE_CARLO_BLOCK = 64
+
+
+def _max_drawdown_pct(equity: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Largest peak-to-trough drop in percent along ``axis`` (0 if none).
+
+    NaN points are skipped, both as peaks and as troughs.
+    """
+    peak = np.fmax.accumulate(equity, axis=axis)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dd = np.where(peak > 0, (peak - equity) / peak * 100, 0.0)
+    return np.fmax(np.fmax.reduce(dd, axis=axis), 0.0)
+
+
+def _as_signal(signal: Any) -> np.ndarray:
+    """Signals as contiguous int64; NaN/inf would otherwise wrap silently on the cast."""
+    signal = np.asarray(signal)
+    if signal.dtype.kind == "f" and not np.isfinite(signal).all():
+        raise ValueError("signal contains NaN or infinite values")
+    return np.ascontiguousarray(signal, dtype=np.int64)
+
+
+def _check_length(name: str, values: Any, n: int) -> None:
+    # The kernel does no bounds checking: shorter arrays would be read past their end
+    if len(values) != n:
+        raise ValueError(f"{name} has length {len(values)}, expected {n} (len(open_))")
+
+
+def _trade_time(timestamps: Optional[Sequence[Any]], idx: int) -> Optional[datetime]:
+    if timestamps is None:
+        return None
+    ts = timestamps[int(idx)]
+    return ts if isinstance(ts, datetime) else ts.to_pydatetime()
 
 
 @dataclass
@@ -14,6 +52,14 @@ class BacktestConfig:
     tp_rr: float
     fee_pct: float = 0.0005
     allow_short: bool = True
+    # "f32" feeds OHLC prices to the simulation as float32 (half the memory
+    # traffic); equity, PnL and trade prices are still accumulated in float64,
+    # with or without numba
+    precision: str = "f64"
+
+    def __post_init__(self):
+        if self.precision not in _PRICE_DTYPES:
+            raise ValueError(f"precision must be one of {sorted(_PRICE_DTYPES)}")
 
 
 @dataclass
@@ -32,6 +78,81 @@ class TradeResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class TradesTable(Sequence[TradeResult]):
+    """
+    Trades stored column-wise, as returned by the simulation kernel.
+
+    Behaves as a read-only sequence of TradeResult; each TradeResult is
+    built on access. Metrics and aggregations should use the column arrays
+    (pnl, entry_price, ...) directly instead of iterating.
+    """
+
+    def __init__(
+        self,
+        entry_idx: np.ndarray,
+        exit_idx: np.ndarray,
+        side: np.ndarray,
+        entry_price: np.ndarray,
+        exit_price: np.ndarray,
+        position_size: np.ndarray,
+        stop_loss_price: np.ndarray,
+        take_profit_price: np.ndarray,
+        pnl: np.ndarray,
+        reason: np.ndarray,
+        timestamps: Optional[Sequence[Any]] = None,
+    ):
+        self.entry_idx = entry_idx
+        self.exit_idx = exit_idx
+        self.side = side  # 1 long, -1 short
+        self.entry_price = entry_price
+        self.exit_price = exit_price
+        self.position_size = position_size
+        self.stop_loss_price = stop_loss_price
+        self.take_profit_price = take_profit_price
+        self.reason = reason  # index into EXIT_REASONS
+        self.timestamps = timestamps
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl_pct = np.where(position_size > 0, pnl / (entry_price * position_size) * 100, 0.0)
+        self.pnl = np.round(pnl, 4)
+        self.pnl_pct = np.round(pnl_pct, 4)
+        self.duration_candles = exit_idx - entry_idx
+
+    @classmethod
+    def empty(cls) -> "TradesTable":
+        """Table with no trades, e.g. when the strategy produced no signals."""
+        idx = np.empty(0, dtype=np.int64)
+        code = np.empty(0, dtype=np.int8)
+        price = np.empty(0, dtype=np.float64)
+        return cls(idx, idx, code, price, price, price, price, price, price, code)
+
+    def __len__(self) -> int:
+        return len(self.pnl)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("trade index out of range")
+
+        return TradeResult(
+            entry_time=_trade_time(self.timestamps, self.entry_idx[i]),
+            exit_time=_trade_time(self.timestamps, self.exit_idx[i]),
+            side="long" if self.side[i] == 1 else "short",
+            entry_price=self.entry_price[i],
+            exit_price=self.exit_price[i],
+            position_size=self.position_size[i],
+            stop_loss_price=self.stop_loss_price[i],
+            take_profit_price=self.take_profit_price[i],
+            pnl=self.pnl[i],
+            pnl_pct=self.pnl_pct[i],
+            duration_candles=int(self.duration_candles[i]),
+            metadata={"exit_reason": EXIT_REASONS[self.reason[i]]},
+        )
+
+
 @dataclass
 class BacktestResult:
     total_return_pct: float = 0.0
@@ -50,7 +171,7 @@ class BacktestResult:
     expectancy: float = 0.0
     recovery_factor: float = 0.0
     equity_curve: List[float] = field(default_factory=list)
-    trades: List[TradeResult] = field(default_factory=list)
+    trades: TradesTable = field(default_factory=TradesTable.empty)
 
 
 class Backtester:
@@ -86,256 +207,239 @@ class Backtester:
         if df_signals.empty or "signal" not in df_signals.columns:
             return BacktestResult()
 
-        has_signal_strength = "signal_strength" in df_signals.columns
-
-        capital = self.config.initial_capital
-        trades: List[TradeResult] = []
-        in_position = False
-        entry_price = 0.0
-        entry_time = None
-        entry_candle_idx = 0
-        side = ""
-        position_size = 0.0
-        sl_price = 0.0
-        tp_price = 0.0
-
-        # Pending signal from previous candle (for next-candle entry)
-        pending_signal = 0
-        pending_signal_strength = 1.0
-
-        # Track equity curve every candle (including unrealized PnL)
-        equity_curve: List[float] = []
-
-        just_exited = False
-
-        for i in range(len(df_signals)):
-            row = df_signals.iloc[i]
-            signal = int(row.get("signal", 0))
-            sig_strength = float(row.get("signal_strength", 1.0)) if has_signal_strength else 1.0
-            high = row["high"]
-            low = row["low"]
-            close = row["close"]
-            open_price = row["open"]
-            ts = row["timestamp"] if "timestamp" in df_signals.columns else df_signals.index[i]
-
-            # Reset just_exited at start of each new candle
-            exited_this_candle = False
-
-            if in_position:
-                # Check if SL or TP hit during this candle
-                exit_price = 0.0
-                exit_reason = ""
-                exited = False
-
-                if side == "long":
-                    sl_hit = low <= sl_price
-                    tp_hit = high >= tp_price
-                    if sl_hit and tp_hit:
-                        # Both could hit -- whichever is closer to open
-                        dist_sl = abs(open_price - sl_price)
-                        dist_tp = abs(open_price - tp_price)
-                        if dist_sl <= dist_tp:
-                            exit_price = sl_price
-                            exit_reason = "sl"
-                        else:
-                            exit_price = tp_price
-                            exit_reason = "tp"
-                        exited = True
-                    elif sl_hit:
-                        exit_price = sl_price
-                        exit_reason = "sl"
-                        exited = True
-                    elif tp_hit:
-                        exit_price = tp_price
-                        exit_reason = "tp"
-                        exited = True
-
-                elif side == "short":
-                    sl_hit = high >= sl_price
-                    tp_hit = low <= tp_price
-                    if sl_hit and tp_hit:
-                        dist_sl = abs(open_price - sl_price)
-                        dist_tp = abs(open_price - tp_price)
-                        if dist_sl <= dist_tp:
-                            exit_price = sl_price
-                            exit_reason = "sl"
-                        else:
-                            exit_price = tp_price
-                            exit_reason = "tp"
-                        exited = True
-                    elif sl_hit:
-                        exit_price = sl_price
-                        exit_reason = "sl"
-                        exited = True
-                    elif tp_hit:
-                        exit_price = tp_price
-                        exit_reason = "tp"
-                        exited = True
-
-                # Also exit on opposing signal
-                if not exited and signal != 0:
-                    if (side == "long" and signal == -1) or (
-                        side == "short" and signal == 1
-                    ):
-                        exit_price = close
-                        exit_reason = "signal_reversal"
-                        exited = True
-
-                if exited:
-                    # Calculate PnL
-                    if side == "long":
-                        raw_pnl = (exit_price - entry_price) * position_size
-                    else:
-                        raw_pnl = (entry_price - exit_price) * position_size
-
-                    # Deduct fees (entry + exit)
-                    fee_cost = (
-                        entry_price * position_size * self.config.fee_pct
-                        + exit_price * position_size * self.config.fee_pct
-                    )
-                    pnl = raw_pnl - fee_cost
-                    pnl_pct = (
-                        (pnl / (entry_price * position_size)) * 100
-                        if position_size > 0
-                        else 0.0
-                    )
-
-                    capital += pnl
-                    duration = i - entry_candle_idx
-
-                    trades.append(
-                        TradeResult(
-                            entry_time=entry_time,
-                            exit_time=ts if isinstance(ts, datetime) else ts.to_pydatetime(),
-                            side=side,
-                            entry_price=entry_price,
-                            exit_price=exit_price,
-                            position_size=position_size,
-                            stop_loss_price=sl_price,
-                            take_profit_price=tp_price,
-                            pnl=round(pnl, 4),
-                            pnl_pct=round(pnl_pct, 4),
-                            duration_candles=duration,
-                            metadata={"exit_reason": exit_reason},
-                        )
-                    )
-                    in_position = False
-                    exited_this_candle = True
-
-            # Execute pending entry from previous candle's signal (enter at this candle's open)
-            if not in_position and not exited_this_candle and pending_signal != 0:
-                if pending_signal == -1 and not self.config.allow_short:
-                    pending_signal = 0
-                    pending_signal_strength = 1.0
-                else:
-                    entry_price = open_price
-                    entry_time = ts if isinstance(ts, datetime) else ts.to_pydatetime()
-                    entry_candle_idx = i
-                    side = "long" if pending_signal == 1 else "short"
-
-                    # Calculate SL/TP prices
-                    if side == "long":
-                        sl_price = entry_price * (1 - self.config.sl_pct)
-                        tp_price = entry_price * (1 + self.config.sl_pct * self.config.tp_rr)
-                    else:
-                        sl_price = entry_price * (1 + self.config.sl_pct)
-                        tp_price = entry_price * (1 - self.config.sl_pct * self.config.tp_rr)
-
-                    # Position sizing using risk management
-                    risk_pct = (
-                        self.risk_config.risk_pct
-                        if hasattr(self.risk_config, "risk_pct")
-                        else 0.01
-                    )
-                    # Scale risk by signal strength
-                    effective_risk = risk_pct * pending_signal_strength
-                    position_size = calculate_position_size_spot(
-                        capital=capital,
-                        entry=entry_price,
-                        stop_loss=sl_price,
-                        risk_pct=effective_risk,
-                    )
-
-                    pending_signal = 0
-                    pending_signal_strength = 1.0
-
-                    if position_size <= 0:
-                        in_position = False
-                    else:
-                        in_position = True
-
-            # Store signal for next candle entry (only if not already in position)
-            if not in_position and signal != 0:
-                pending_signal = signal
-                pending_signal_strength = sig_strength
-            elif in_position:
-                # Clear any pending signal while in position
-                pending_signal = 0
-                pending_signal_strength = 1.0
-
-            # Update equity curve with unrealized PnL
-            if in_position:
-                if side == "long":
-                    unrealized = (close - entry_price) * position_size
-                else:
-                    unrealized = (entry_price - close) * position_size
-                equity_curve.append(capital + unrealized)
-            else:
-                equity_curve.append(capital)
+        timestamps = (
+            df_signals["timestamp"].array
+            if "timestamp" in df_signals.columns
+            else df_signals.index
+        )
+        signal_strength = (
+            df_signals["signal_strength"].to_numpy(dtype=np.float64)
+            if "signal_strength" in df_signals.columns
+            else None
+        )
+
+        return self.run_arrays(
+            df_signals["open"].to_numpy(dtype=np.float64),
+            df_signals["high"].to_numpy(dtype=np.float64),
+            df_signals["low"].to_numpy(dtype=np.float64),
+            df_signals["close"].to_numpy(dtype=np.float64),
+            df_signals["signal"].to_numpy(),
+            signal_strength=signal_strength,
+            timestamps=timestamps,
+        )
+
+    def run_arrays(
+        self,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        signal: np.ndarray,
+        signal_strength: Optional[np.ndarray] = None,
+        timestamps: Optional[Sequence[Any]] = None,
+    ) -> BacktestResult:
+        """
+        Simulate trades over pre-computed signals given as column arrays.
+
+        Same rules as backtest(), without the DataFrame and strategy layer.
+        Inputs that are already contiguous arrays of the configured
+        precision (signal: int64) are used without copying.
+
+        Raises:
+            ValueError: If the arrays differ in length or signal has NaN/inf
+
+        Args:
+            open_, high, low, close: Price arrays of equal length
+            signal: 1 (long), -1 (short) or 0 per bar
+            signal_strength: Optional risk multiplier per bar (defaults to 1.0)
+            timestamps: Optional per-bar timestamps used for trade entry/exit
+                times; trade times are None when omitted
+
+        Returns:
+            BacktestResult with trades and performance metrics
+        """
+        n = len(open_)
+        signal = _as_signal(signal)
+        if signal_strength is None:
+            signal_strength = np.ones(n, dtype=np.float64)
+        for name, values in (
+            ("high", high),
+            ("low", low),
+            ("close", close),
+            ("signal", signal),
+            ("signal_strength", signal_strength),
+        ):
+            _check_length(name, values, n)
+
+        walk = _walk(
+            self._prices(open_),
+            self._prices(high),
+            self._prices(low),
+            self._prices(close),
+            signal,
+            np.ascontiguousarray(signal_strength, dtype=np.float64),
+            float(self.config.initial_capital),
+            float(self.config.sl_pct),
+            float(self.config.tp_rr),
+            float(self.config.fee_pct),
+            float(self._risk_pct()),
+            bool(self.config.allow_short),
+            np.empty(n, dtype=np.float64),
+        )
+        return self._result_from_walk(walk, timestamps)
+
+    def run_batch(
+        self,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        signals: np.ndarray,
+        signal_strengths: Optional[np.ndarray] = None,
+        timestamps: Optional[Sequence[Any]] = None,
+        configs: Optional[Sequence[BacktestConfig]] = None,
+    ) -> List[BacktestResult]:
+        """
+        Run independent backtests of many signal series over the same prices.
+
+        Intended for parameter sweeps: each row of ``signals`` is simulated
+        exactly as run_arrays() would with its config, and rows run in
+        parallel threads when numba is available.
+
+        Args:
+            open_, high, low, close: Price arrays of length n
+            signals: (runs, n) array of 1 / -1 / 0 signals
+            signal_strengths: Optional (runs, n) risk multipliers
+            timestamps: Optional per-bar timestamps for trade entry/exit times
+            configs: Optional BacktestConfig per row (capital, SL/TP, fees,
+                shorting); defaults to this backtester's config for every row.
+                Prices are shared, so all must use this backtester's precision.
+
+        Returns:
+            One BacktestResult per row of ``signals``
+
+        Raises:
+            ValueError: On mismatched shapes, NaN/inf signals, or configs
+                whose length or precision does not match
+        """
+        n = len(open_)
+        for name, values in (("high", high), ("low", low), ("close", close)):
+            _check_length(name, values, n)
+        signals = _as_signal(signals)
+        if signals.ndim != 2 or signals.shape[1] != n:
+            raise ValueError(f"signals must have shape (runs, {n}), got {signals.shape}")
+        n_runs = signals.shape[0]
+        if signal_strengths is None:
+            signal_strengths = np.ones(signals.shape, dtype=np.float64)
+        elif np.shape(signal_strengths) != signals.shape:
+            raise ValueError(
+                f"signal_strengths must have shape {signals.shape}, "
+                f"got {np.shape(signal_strengths)}"
+            )
+        if configs is None:
+            configs = [self.config] * n_runs
+        elif len(configs) != n_runs:
+            raise ValueError(f"configs has {len(configs)} entries, expected {n_runs} (one per run)")
+        if any(cfg.precision != self.config.precision for cfg in configs):
+            raise ValueError(f"all configs must use precision {self.config.precision!r}")
+
+        def per_run(attr: str, dtype) -> np.ndarray:
+            return np.array([getattr(cfg, attr) for cfg in configs], dtype=dtype)
+
+        batch = _walk_batch(
+            self._prices(open_),
+            self._prices(high),
+            self._prices(low),
+            self._prices(close),
+            signals,
+            np.ascontiguousarray(signal_strengths, dtype=np.float64),
+            per_run("initial_capital", np.float64),
+            per_run("sl_pct", np.float64),
+            per_run("tp_rr", np.float64),
+            per_run("fee_pct", np.float64),
+            np.full(n_runs, self._risk_pct(), dtype=np.float64),
+            per_run("allow_short", np.bool_),
+        )
+        equity, *columns, offsets, final_capital = batch
+        results = []
+        for r, cfg in enumerate(configs):
+            start, end = offsets[r], offsets[r + 1]
+            walk = (equity[r], *(col[start:end] for col in columns), end - start, final_capital[r])
+            # Metrics (returns, recovery factor) are relative to the run's own capital
+            backtester = self if cfg is self.config else Backtester(cfg, self.risk_config)
+            results.append(backtester._result_from_walk(walk, timestamps))
+        return results
+
+    def _prices(self, values: np.ndarray) -> np.ndarray:
+        return np.ascontiguousarray(values, dtype=_PRICE_DTYPES[self.config.precision])
+
+    def _risk_pct(self) -> float:
+        return self.risk_config.risk_pct if hasattr(self.risk_config, "risk_pct") else 0.01
+
+    def _result_from_walk(self, walk: tuple, timestamps: Optional[Sequence[Any]]) -> BacktestResult:
+        """Build TradeResults and metrics from the kernel's output arrays."""
+        equity, *columns, n_trades, capital = walk
+
+        # Copy the valid part: results must not keep the kernel's buffers alive
+        trades = TradesTable(*(col[:n_trades].copy() for col in columns), timestamps=timestamps)
 
         # Calculate metrics
-        result = self._calculate_metrics(trades, capital, equity_curve)
+        result = self._calculate_metrics(trades, float(capital), equity)
         return result
 
     def _calculate_metrics(
         self,
-        trades: List[TradeResult],
+        trades: TradesTable,
         final_capital: float,
-        equity_curve: List[float],
+        equity: np.ndarray,
     ) -> BacktestResult:
-        """Calculate backtest performance metrics from trade list."""
-        if not trades:
+        """Calculate backtest performance metrics from the trade columns and equity array."""
+        if not len(trades):
             return BacktestResult(
-                equity_curve=equity_curve if equity_curve else [self.config.initial_capital]
+                equity_curve=equity.tolist() if len(equity) else [self.config.initial_capital],
+                trades=trades,
             )
 
-        winning = [t for t in trades if t.pnl > 0]
-        losing = [t for t in trades if t.pnl <= 0]
+        pnls = trades.pnl
+        wins = pnls > 0
+        losses = pnls <= 0
+        n_trades = len(trades)
+        n_wins = int(np.count_nonzero(wins))
+        n_losses = int(np.count_nonzero(losses))
 
         total_return_pct = (
             (final_capital - self.config.initial_capital) / self.config.initial_capital
         ) * 100
 
-        winrate = (len(winning) / len(trades)) * 100 if trades else 0.0
+        winrate = (n_wins / n_trades) * 100
 
-        gross_profit = sum(t.pnl for t in winning)
-        gross_loss = abs(sum(t.pnl for t in losing))
+        gross_profit = float(pnls[wins].sum())
+        gross_loss = abs(float(pnls[losses].sum()))
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float("inf")
         if profit_factor == float("inf"):
             profit_factor = 99.99
 
         # Max drawdown from full equity curve (intra-trade)
-        max_dd = self._calculate_max_drawdown_from_curve(equity_curve)
+        max_dd = self._calculate_max_drawdown_from_curve(equity)
 
         # Sharpe, Sortino, Calmar ratios
-        sharpe = self._calculate_sharpe_ratio(equity_curve)
-        sortino = self._calculate_sortino_ratio(equity_curve)
+        sharpe = self._calculate_sharpe_ratio(equity)
+        sortino = self._calculate_sortino_ratio(equity)
         annualized_return = total_return_pct / 100  # as a fraction
         calmar = (annualized_return / (max_dd / 100)) if max_dd > 0 else 99.99
 
         # Average trade duration
-        avg_duration = (
-            sum(t.duration_candles for t in trades) / len(trades) if trades else 0.0
-        )
+        avg_duration = float(trades.duration_candles.sum()) / n_trades
 
         # Max consecutive wins/losses
-        max_consec_wins, max_consec_losses = self._max_consecutive(trades)
+        max_consec_wins = self._longest_run(wins)
+        max_consec_losses = self._longest_run(~wins)
 
         # Expectancy
-        win_rate_frac = len(winning) / len(trades) if trades else 0
-        loss_rate_frac = len(losing) / len(trades) if trades else 0
-        avg_win = gross_profit / len(winning) if winning else 0
-        avg_loss = gross_loss / len(losing) if losing else 0
+        win_rate_frac = n_wins / n_trades
+        loss_rate_frac = n_losses / n_trades
+        avg_win = gross_profit / n_wins if n_wins else 0
+        avg_loss = gross_loss / n_losses if n_losses else 0
         expectancy = (win_rate_frac * avg_win) - (loss_rate_frac * avg_loss)
 
         # Recovery factor
@@ -347,9 +451,9 @@ class Backtester:
             winrate_pct=round(winrate, 2),
             profit_factor=round(profit_factor, 4),
             max_drawdown_pct=round(max_dd, 4),
-            num_trades=len(trades),
-            winning_trades=len(winning),
-            losing_trades=len(losing),
+            num_trades=n_trades,
+            winning_trades=n_wins,
+            losing_trades=n_losses,
             sharpe_ratio=round(sharpe, 4),
             sortino_ratio=round(sortino, 4),
             calmar_ratio=round(calmar, 4),
@@ -358,33 +462,23 @@ class Backtester:
             max_consecutive_losses=max_consec_losses,
             expectancy=round(expectancy, 4),
             recovery_factor=round(recovery_factor, 4),
-            equity_curve=equity_curve,
+            equity_curve=equity.tolist(),
             trades=trades,
         )
 
-    def _calculate_max_drawdown_from_curve(self, equity_curve: List[float]) -> float:
+    def _calculate_max_drawdown_from_curve(self, equity_curve: Sequence[float]) -> float:
         """Calculate maximum drawdown percentage from the full equity curve."""
-        if not equity_curve:
+        if len(equity_curve) == 0:
             return 0.0
 
-        peak = equity_curve[0]
-        max_dd = 0.0
-
-        for equity in equity_curve:
-            if equity > peak:
-                peak = equity
-            dd = ((peak - equity) / peak) * 100 if peak > 0 else 0.0
-            if dd > max_dd:
-                max_dd = dd
-
-        return max_dd
+        return float(_max_drawdown_pct(np.asarray(equity_curve, dtype=np.float64)))
 
-    def _calculate_sharpe_ratio(self, equity_curve: List[float]) -> float:
+    def _calculate_sharpe_ratio(self, equity_curve: Sequence[float]) -> float:
         """Annualized Sharpe Ratio from equity curve returns (assuming 252 trading days)."""
         if len(equity_curve) < 2:
             return 0.0
 
-        arr = np.array(equity_curve)
+        arr = np.asarray(equity_curve, dtype=np.float64)
         returns = np.diff(arr) / arr[:-1]
 
         if len(returns) == 0 or np.std(returns) == 0:
@@ -392,12 +486,12 @@ class Backtester:
 
         return float((np.mean(returns) / np.std(returns)) * np.sqrt(252))
 
-    def _calculate_sortino_ratio(self, equity_curve: List[float]) -> float:
+    def _calculate_sortino_ratio(self, equity_curve: Sequence[float]) -> float:
         """Annualized Sortino Ratio (downside deviation only)."""
         if len(equity_curve) < 2:
             return 0.0
 
-        arr = np.array(equity_curve)
+        arr = np.asarray(equity_curve, dtype=np.float64)
         returns = np.diff(arr) / arr[:-1]
 
         downside = returns[returns < 0]
@@ -411,26 +505,12 @@ class Backtester:
         return float((np.mean(returns) / downside_std) * np.sqrt(252))
 
     @staticmethod
-    def _max_consecutive(trades: List[TradeResult]) -> tuple:
-        """Return (max_consecutive_wins, max_consecutive_losses)."""
-        max_wins = 0
-        max_losses = 0
-        cur_wins = 0
-        cur_losses = 0
-
-        for t in trades:
-            if t.pnl > 0:
-                cur_wins += 1
-                cur_losses = 0
-                if cur_wins > max_wins:
-                    max_wins = cur_wins
-            else:
-                cur_losses += 1
-                cur_wins = 0
-                if cur_losses > max_losses:
-                    max_losses = cur_losses
-
-        return max_wins, max_losses
+    def _longest_run(mask: np.ndarray) -> int:
+        """Length of the longest run of True values in a boolean array."""
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+        if edges.size == 0:
+            return 0
+        return int((edges[1::2] - edges[::2]).max())
 
     def walk_forward_backtest(
         self,
@@ -468,9 +548,7 @@ class Backtester:
 
         return results
 
-    def monte_carlo(
-        self, trades: List[TradeResult], n_simulations: int = 1000
-    ) -> Dict[str, Any]:
+    def monte_carlo(self, trades: TradesTable, n_simulations: int = 1000) -> Dict[str, Any]:
         """
         Monte Carlo simulation: shuffle trade PnLs and compute distribution of outcomes.
 
@@ -479,33 +557,25 @@ class Backtester:
         if not trades:
             return {"final_equity": {}, "max_drawdown": {}}
 
-        pnls = np.array([t.pnl for t in trades])
+        pnls = trades.pnl
         initial = self.config.initial_capital
 
-        final_equities = []
-        max_drawdowns = []
-
         rng = np.random.default_rng(seed=42)
+        final_equities = np.empty(n_simulations)
+        max_drawdowns = np.empty(n_simulations)
+
+        # Simulations are vectorized in blocks of rows so memory stays
+        # O(block x trades) instead of O(simulations x trades)
+        for start in range(0, n_simulations, _MONTE_CARLO_BLOCK):
+            rows = min(_MONTE_CARLO_BLOCK, n_simulations - start)
+            shuffled = np.stack([rng.permutation(pnls) for _ in range(rows)])
+
+            # One equity path per row, starting from the initial capital
+            paths = np.concatenate((np.full((rows, 1), initial), shuffled), axis=1)
+            paths = np.cumsum(paths, axis=1)
 
-        for _ in range(n_simulations):
-            shuffled = rng.permutation(pnls)
-            equity = initial
-            peak = equity
-            max_dd = 0.0
-
-            for pnl in shuffled:
-                equity += pnl
-                if equity > peak:
-                    peak = equity
-                dd = ((peak - equity) / peak) * 100 if peak > 0 else 0.0
-                if dd > max_dd:
-                    max_dd = dd
-
-            final_equities.append(equity)
-            max_drawdowns.append(max_dd)
-
-        final_equities = np.array(final_equities)
-        max_drawdowns = np.array(max_drawdowns)
+            final_equities[start : start + rows] = paths[:, -1]
+            max_drawdowns[start : start + rows] = _max_drawdown_pct(paths, axis=1)
 
         percentiles = [5, 25, 50, 75, 95]
 
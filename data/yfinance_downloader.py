@@ -1,4 +1,3 @@
-import yfinance as yf
 import pandas as pd
 from typing import Optional
 
@@ -15,6 +14,8 @@ def get_yfinance_data(
         return cached
 
     try:
+        import yfinance as yf
+
         interval = timeframe
 
         ticker = yf.Ticker(symbol)
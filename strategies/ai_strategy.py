@@ -94,9 +94,9 @@ class AIStrategy(BaseStrategy[AIStrategyConfig]):
             self.model = model_data["model"]
             self._feature_cols = model_data.get("feature_cols", [])
             self.is_trained = True
-            logger.info(f"Modelo AI cargado desde {path}")
+            logger.info("Modelo AI cargado desde %s", path)
         except Exception as e:
-            logger.warning(f"No se pudo cargar el modelo desde {path}: {e}")
+            logger.warning("No se pudo cargar el modelo desde %s: %s", path, e)
             self.model = HistGradientBoostingClassifier(
                 learning_rate=self.config.learning_rate,
                 max_iter=self.config.max_iter,
@@ -124,7 +124,7 @@ class AIStrategy(BaseStrategy[AIStrategyConfig]):
             "config": self.config,
         }
         joblib.dump(model_data, path)
-        logger.info(f"Modelo AI guardado en {path}")
+        logger.info("Modelo AI guardado en %s", path)
 
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
         required_cols = {"timestamp", "open", "high", "low", "close", "volume"}
@@ -1,9 +1,11 @@
 
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 import ta
 
 from strategies.base import BaseStrategy, StrategyMetadata
+from utils._njit import NUMBA_AVAILABLE, njit
 from utils.validation import (
     validate_window_size,
     validate_multiplier,
@@ -11,6 +13,51 @@ from utils.validation import (
 )
 
 
+@njit(cache=True)
+def _sma_std(close: np.ndarray, window: int):
+    """
+    Media móvil y desviación estándar poblacional (ddof=0) en una sola pasada.
+
+    Ventana deslizante con actualización de Welford (alta/baja de cada vela),
+    O(N). Igual que pandas con min_periods=window: NaN hasta tener `window`
+    observaciones válidas en la ventana.
+    """
+    n = close.shape[0]
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0
+
+    for i in range(n):
+        val = close[i]
+        if val == val:
+            nobs += 1
+            delta = val - mean
+            mean += delta / nobs
+            ssqdm += delta * (val - mean)
+
+        if i >= window:
+            old = close[i - window]
+            if old == old:
+                nobs -= 1
+                if nobs > 0:
+                    delta = old - mean
+                    mean -= delta / nobs
+                    ssqdm -= delta * (old - mean)
+                else:
+                    mean = 0.0
+                    ssqdm = 0.0
+
+        if nobs >= window:
+            var = ssqdm / nobs
+            mean_out[i] = mean
+            std_out[i] = np.sqrt(var) if var > 0.0 else 0.0
+
+    return mean_out, std_out
+
+
 @dataclass
 class BollingerMeanReversionStrategyConfig:
     """
@@ -63,13 +110,18 @@ class BollingerMeanReversionStrategy(BaseStrategy[BollingerMeanReversionStrategy
         # ============================
         # 1) Calcular Bollinger Bands
         # ============================
-        bb_ind = ta.volatility.BollingerBands(
-            close=data["close"], 
-            window=c.bb_window, 
-            window_dev=c.bb_std
-        )
-        data["bb_upper"] = bb_ind.bollinger_hband()
-        data["bb_lower"] = bb_ind.bollinger_lband()
+        if NUMBA_AVAILABLE:
+            mid, std = _sma_std(data["close"].to_numpy(dtype=np.float64), c.bb_window)
+            data["bb_upper"] = mid + c.bb_std * std
+            data["bb_lower"] = mid - c.bb_std * std
+        else:
+            bb_ind = ta.volatility.BollingerBands(
+                close=data["close"], 
+                window=c.bb_window, 
+                window_dev=c.bb_std
+            )
+            data["bb_upper"] = bb_ind.bollinger_hband()
+            data["bb_lower"] = bb_ind.bollinger_lband()
         
         # ============================
         # 2) Calcular RSI
@@ -45,7 +45,7 @@ class ICTStrategy(BaseStrategy[ICTStrategyConfig]):
         super().__init__(config=config, meta=meta)
 
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
-        data = df.copy().reset_index(drop=True)
+        data = df.reset_index(drop=True)
         
         # Asegurar datetime
         if not pd.api.types.is_datetime64_any_dtype(data['timestamp']):
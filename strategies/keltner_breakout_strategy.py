@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 from .base import BaseStrategy, StrategyMetadata
+from utils._njit import NUMBA_AVAILABLE, njit
 from utils.validation import (
     ValidationError,
     validate_window_size,
@@ -15,6 +16,51 @@ import numpy as np
 import pandas as pd
 
 
+@njit(cache=True)
+def _atr_wilder(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int) -> np.ndarray:
+    """
+    ATR con suavizado de Wilder (EMA con alpha = 1/window).
+
+    Equivale a KeltnerBreakoutStrategy._atr: el True Range ignora NaN como
+    max(axis=1) y la media replica ewm(adjust=False) de pandas, incluido el
+    decaimiento de pesos a través de huecos NaN. La recursión es secuencial,
+    por eso se compila en lugar de vectorizarse.
+    """
+    n = high.shape[0]
+    out = np.empty(n)
+    alpha = 1.0 / window
+    old_wt_factor = 1.0 - alpha
+
+    weighted = np.nan
+    old_wt = 1.0
+
+    for i in range(n):
+        # True Range (NaN-skipping max de los tres rangos)
+        tr = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            up = abs(high[i] - prev_close)
+            down = abs(low[i] - prev_close)
+            if up == up and (tr != tr or up > tr):
+                tr = up
+            if down == down and (tr != tr or down > tr):
+                tr = down
+
+        is_observation = tr == tr
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != tr:
+                    weighted = (old_wt * weighted + alpha * tr) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = tr
+
+        out[i] = weighted
+
+    return out
+
+
 @dataclass
 class KeltnerBreakoutStrategyConfig:
     """
@@ -107,15 +153,23 @@ class KeltnerBreakoutStrategy(BaseStrategy[KeltnerBreakoutStrategyConfig]):
             missing = required_cols - set(df.columns)
             raise ValueError(f"Faltan columnas necesarias en el DataFrame: {missing}")
 
-        data = df.sort_values("timestamp").reset_index(drop=True).copy()
+        data = df.sort_values("timestamp").reset_index(drop=True)
 
         # ATR
-        data["atr"] = self._atr(
-            high=data["high"],
-            low=data["low"],
-            close=data["close"],
-            window=self.config.atr_window,
-        )
+        if NUMBA_AVAILABLE:
+            data["atr"] = _atr_wilder(
+                data["high"].to_numpy(dtype=np.float64),
+                data["low"].to_numpy(dtype=np.float64),
+                data["close"].to_numpy(dtype=np.float64),
+                self.config.atr_window,
+            )
+        else:
+            data["atr"] = self._atr(
+                high=data["high"],
+                low=data["low"],
+                close=data["close"],
+                window=self.config.atr_window,
+            )
 
         # Media central del canal Keltner (EMA del close)
         data["kc_mid"] = self._ema(data["close"], window=self.config.kc_window)
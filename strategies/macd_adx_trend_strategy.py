@@ -132,7 +132,7 @@ class MACDADXTrendStrategy(BaseStrategy[MACDADXTrendStrategyConfig]):
             missing = required_cols - set(df.columns)
             raise ValueError(f"Faltan columnas necesarias en el DataFrame: {missing}")
 
-        data = df.sort_values("timestamp").reset_index(drop=True).copy()
+        data = df.sort_values("timestamp").reset_index(drop=True)
 
         # Filtro de tendencia
         data["ema_trend"] = self._ema(
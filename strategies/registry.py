@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple, Type
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Type
 
 from .base import BaseStrategy
 from .ma_rsi_strategy import (
@@ -55,7 +56,7 @@ from strategies.composite_strategy import CompositeStrategy, CompositeConfig
 
 # Mapa: tipo_de_estrategia -> (ClaseEstrategia, ClaseConfig)
 # Los strings deben coincidir con los strategy_type que usas en config/settings.py
-STRATEGY_REGISTRY: Dict[str, Tuple[Type[BaseStrategy], Type]] = {
+_REGISTRY: Dict[str, Tuple[Type[BaseStrategy], Type]] = {
     "MA_RSI": (MovingAverageRSIStrategy, MovingAverageRSIStrategyConfig),
     "MACD_ADX": (MACDADXTrendStrategy, MACDADXTrendStrategyConfig),
     "KELTNER": (KeltnerBreakoutStrategy, KeltnerBreakoutStrategyConfig),
@@ -78,6 +79,9 @@ STRATEGY_REGISTRY: Dict[str, Tuple[Type[BaseStrategy], Type]] = {
     "COMPOSITE": (CompositeStrategy, CompositeConfig),
 }
 
+# Vista de solo lectura: el registro no debe modificarse en tiempo de ejecución
+STRATEGY_REGISTRY: Mapping[str, Tuple[Type[BaseStrategy], Type]] = MappingProxyType(_REGISTRY)
+
 
 def create_strategy(strategy_type: str, config_obj) -> BaseStrategy:
     """
@@ -47,7 +47,7 @@ class SmartMoneyStrategy(BaseStrategy[SmartMoneyStrategyConfig]):
         """
         Genera señales basadas en re-test de FVGs u OBs.
         """
-        data = df.copy().reset_index(drop=True)
+        data = df.reset_index(drop=True)
         
         # 1. Indicadores básicos
         data['ema_trend'] = data['close'].ewm(span=self.config.trend_ema_window, adjust=False).mean()
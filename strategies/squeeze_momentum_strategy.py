@@ -61,7 +61,7 @@ class SqueezeMomentumStrategy(BaseStrategy[SqueezeMomentumConfig]):
             missing = required - set(df.columns)
             raise ValueError(f"Faltan columnas necesarias en el DataFrame de entrada: {missing}")
 
-        data = df.sort_values("timestamp").reset_index(drop=True).copy()
+        data = df.sort_values("timestamp").reset_index(drop=True)
 
         close = data["close"]
         high = data["high"]
@@ -5,6 +5,7 @@ import numpy as np
 import ta
 
 from strategies.base import BaseStrategy, StrategyMetadata
+from utils._njit import njit
 from utils.validation import (
     ValidationError,
     validate_window_size,
@@ -13,6 +14,44 @@ from utils.validation import (
 )
 
 
+@njit(cache=True)
+def _supertrend_loop(bu: np.ndarray, bl: np.ndarray, cl: np.ndarray):
+    """
+    Bandas finales, dirección de tendencia y valor del Supertrend.
+
+    El Supertrend es recursivo (cada banda depende de la anterior), así que
+    se calcula vela a vela. Devuelve (supertrend, trend_dir).
+    """
+    n = cl.shape[0]
+    fu = np.empty(n, dtype=np.float64)
+    fl = np.empty(n, dtype=np.float64)
+    tr = np.empty(n, dtype=np.int64)
+    st = np.empty(n, dtype=np.float64)
+
+    fu[0] = bu[0]
+    fl[0] = bl[0]
+    tr[0] = 0
+    st[0] = np.nan
+
+    for i in range(1, n):
+        # Final upper band
+        fu[i] = bu[i] if (bu[i] < fu[i - 1] or cl[i - 1] > fu[i - 1]) else fu[i - 1]
+
+        # Final lower band
+        fl[i] = bl[i] if (bl[i] > fl[i - 1] or cl[i - 1] < fl[i - 1]) else fl[i - 1]
+
+        # Trend direction
+        if tr[i - 1] == 1:
+            tr[i] = -1 if cl[i] < fl[i] else 1
+        else:
+            tr[i] = 1 if cl[i] > fu[i] else -1
+
+        # Supertrend value
+        st[i] = fl[i] if tr[i] == 1 else fu[i]
+
+    return st, tr
+
+
 @dataclass
 class SupertrendStrategyConfig:
     """
@@ -98,37 +137,12 @@ class SupertrendStrategy(BaseStrategy[SupertrendStrategyConfig]):
         basic_upper = hl2 + m * atr
         basic_lower = hl2 - m * atr
 
-        # Use numpy arrays for fast iteration (Supertrend is inherently recursive)
-        n = len(data)
-        bu = basic_upper.values
-        bl = basic_lower.values
-        cl = close.values
-
-        fu = np.empty(n, dtype=np.float64)
-        fl = np.empty(n, dtype=np.float64)
-        tr = np.empty(n, dtype=np.int64)
-        st = np.empty(n, dtype=np.float64)
-
-        fu[0] = bu[0]
-        fl[0] = bl[0]
-        tr[0] = 0
-        st[0] = np.nan
-
-        for i in range(1, n):
-            # Final upper band
-            fu[i] = bu[i] if (bu[i] < fu[i - 1] or cl[i - 1] > fu[i - 1]) else fu[i - 1]
-
-            # Final lower band
-            fl[i] = bl[i] if (bl[i] > fl[i - 1] or cl[i - 1] < fl[i - 1]) else fl[i - 1]
-
-            # Trend direction
-            if tr[i - 1] == 1:
-                tr[i] = -1 if cl[i] < fl[i] else 1
-            else:
-                tr[i] = 1 if cl[i] > fu[i] else -1
-
-            # Supertrend value
-            st[i] = fl[i] if tr[i] == 1 else fu[i]
+        # Supertrend is inherently recursive: numba kernel over numpy arrays
+        st, tr = _supertrend_loop(
+            basic_upper.to_numpy(dtype=np.float64),
+            basic_lower.to_numpy(dtype=np.float64),
+            close.to_numpy(dtype=np.float64),
+        )
 
         data["supertrend"] = st
         data["trend_dir"] = tr
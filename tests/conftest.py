@@ -1,8 +1,10 @@
 """Test fixtures and configuration."""
 
+import os
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
@@ -14,10 +16,17 @@ project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# Keep the app's own engine (used by the lifespan init_db) off the shared
+# ./trading_bot.db file so parallel pytest-xdist workers never contend on it
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+# bcrypt's minimum cost: hashing at the production cost dominates auth test time
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 from backend.app.main import app
 from backend.app.database import get_db
 from backend.app.models import Base, User
 from backend.app.api.auth import hash_password, create_access_token
+from utils._njit import NUMBA_AVAILABLE
 
 # Use in-memory SQLite with StaticPool so same connection is reused
 engine = create_engine(
@@ -25,17 +34,67 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Sessions join the per-test transaction through a SAVEPOINT, so commit()
+# and rollback() in app/service code never end the outer transaction
+TestSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, join_transaction_mode="create_savepoint"
+)
 
 
-@pytest.fixture(autouse=True)
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    """Let SQLAlchemy emit BEGIN itself; pysqlite's own handling breaks SAVEPOINT."""
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session", autouse=True)
 def setup_database():
-    """Create tables before each test and drop after."""
+    """Create tables once for the whole session."""
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def db_connection(setup_database):
+    """Run each test in a transaction that is rolled back afterwards."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    TestSessionLocal.configure(bind=connection)
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_numba():
+    """Compile (or load from cache) the JIT kernels before any test is timed."""
+    if not NUMBA_AVAILABLE:
+        return
+    from backtesting._engine_loop import _walk, _walk_batch
+    from strategies.bollinger_mean_reversion import _sma_std
+    from strategies.keltner_breakout_strategy import _atr_wilder
+    from strategies.supertrend_strategy import _supertrend_loop
+
+    arr = np.arange(1.0, 65.0)
+    _sma_std(arr, 20)
+    _atr_wilder(arr + 1.0, arr - 1.0, arr, 14)
+    _supertrend_loop(arr + 1.0, arr - 1.0, arr)
+
+    ones = np.ones(2)
+    signal = np.zeros(2, dtype=np.int64)
+    _walk(ones, ones, ones, ones, signal, ones, 10.0, 0.01, 2.0, 0.0, 0.01, True, np.empty(2))
+    p = np.ones(1)  # one run: per-run parameter arrays
+    _walk_batch(ones, ones, ones, ones, signal[None], ones[None], p, p, p, p, p, p > 0)
+
+
 def _override_get_db():
     session = TestSessionLocal()
     try:
@@ -58,28 +117,39 @@ def db_session():
         session.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client."""
+    """Create one test client (and run the app lifespan once) per session.
+
+    Isolation comes from the per-test transaction rollback, not from
+    rebuilding the client.
+    """
     with TestClient(app, raise_server_exceptions=False) as c:
         yield c
 
 
-@pytest.fixture
-def test_user(db_session):
-    """Create a test user and return it."""
-    user = User(
-        username="testuser",
-        email="test@example.com",
-        hashed_password=hash_password("testpassword"),
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+@pytest.fixture(scope="session")
+def test_user(setup_database):
+    """Create the test user once, outside the per-test transactions.
+
+    Committed before any test transaction begins, so it survives every
+    rollback. The returned instance is detached; only its loaded columns
+    (id, username, email...) should be used.
+    """
+    with Session(bind=engine) as session:
+        user = User(
+            username="testuser",
+            email="test@example.com",
+            hashed_password=hash_password("testpassword"),
+        )
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        session.expunge(user)
     return user
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers(test_user):
     """Return authorization headers for the test user."""
     token = create_access_token(data={"sub": str(test_user.id)})
@@ -30,6 +30,7 @@ def _create_test_strategy(db_session, owner_id):
     return strategy
 
 
+@pytest.mark.slow
 @pytest.mark.integration
 def test_backtest_service_run(db_session, test_user):
     """Test running a backtest via BacktestService.
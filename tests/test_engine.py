@@ -0,0 +1,427 @@
+"""Tests for the backtesting engine trade simulation."""
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting._engine_loop import _walk
+from backtesting.engine import BacktestConfig, Backtester, TradesTable
+from utils._njit import NUMBA_AVAILABLE
+from utils.risk import RiskManagementConfig, calculate_position_size_spot
+
+
+class _PresetSignalStrategy:
+    """Strategy stub that returns the 'signal' column already present in the data."""
+
+    def __init__(self, config=None):
+        self.config = config
+
+    def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.copy()
+
+
+def _make_df(signal, open_=None, high=None, low=None, close=None, n=10):
+    """Build an OHLC frame around 100 from pre-built arrays."""
+    base = np.full(n, 100.0)
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=n, freq="h"),
+            "open": base if open_ is None else open_,
+            "high": base + 0.5 if high is None else high,
+            "low": base - 0.5 if low is None else low,
+            "close": base if close is None else close,
+            "volume": np.ones(n),
+            "signal": signal,
+        }
+    )
+    return df
+
+
+def _run(df, allow_short=True):
+    config = BacktestConfig(
+        initial_capital=10000, sl_pct=0.01, tp_rr=2.0, fee_pct=0.0, allow_short=allow_short
+    )
+    backtester = Backtester(config, RiskManagementConfig(risk_pct=0.01))
+    return backtester.backtest(df, _PresetSignalStrategy, None)
+
+
+def _signal(at, n=10):
+    """Signal array with the given {bar index: signal} values set."""
+    signal = np.zeros(n, dtype=np.int64)
+    for idx, value in at.items():
+        signal[idx] = value
+    return signal
+
+
+@pytest.fixture(scope="module")
+def base_df():
+    """Flat 10-bar frame around 100, shared by the module; tests mutate copies."""
+    return _make_df(_signal({}))
+
+
+def _set(column, where, value):
+    def mutate(arrays):
+        arrays[column][where] = value
+
+    return mutate
+
+
+@pytest.mark.parametrize(
+    "signal_at,mutate,side,entry_bar,exit_bar,exit_price,reason,pnl",
+    [
+        # Long entry at the open after the signal, TP at 100 * (1 + 0.01 * 2)
+        ({1: 1}, _set("high", 4, 102.5), "long", 2, 4, 102.0, "tp", 200.0),
+        # Long stopped out at 99; risking 1% of capital on a 1% stop loss
+        ({1: 1}, _set("low", slice(3, 8), 98.5), "long", 2, 3, 99.0, "sl", -100.0),
+        ({2: -1}, _set("low", 5, 97.5), "short", 3, 5, 98.0, "tp", 200.0),
+    ],
+    ids=["long_tp", "long_sl", "short_tp"],
+)
+def test_trip(base_df, signal_at, mutate, side, entry_bar, exit_bar, exit_price, reason, pnl):
+    """A signal enters at the next open and exits at the SL/TP price."""
+    arrays = {col: base_df[col].to_numpy(copy=True) for col in ("open", "high", "low", "close")}
+    mutate(arrays)
+    df = _make_df(
+        _signal(signal_at),
+        open_=arrays["open"],
+        high=arrays["high"],
+        low=arrays["low"],
+        close=arrays["close"],
+    )
+    result = _run(df)
+
+    assert result.num_trades == 1
+    trade = result.trades[0]
+    assert trade.side == side
+    assert trade.entry_price == 100.0
+    assert trade.entry_time == base_df["timestamp"].iloc[entry_bar]
+    assert trade.duration_candles == exit_bar - entry_bar
+    assert trade.exit_price == pytest.approx(exit_price)
+    assert trade.metadata["exit_reason"] == reason
+    assert trade.pnl == pytest.approx(pnl)
+
+
+def test_short_signals_ignored_without_allow_short():
+    """Short signals are skipped when allow_short is disabled."""
+    low = np.full(10, 99.5)
+    low[5] = 97.5
+    result = _run(_make_df(_signal({2: -1}), low=low), allow_short=False)
+
+    assert result.num_trades == 0
+    assert result.equity_curve == [10000.0] * 10
+
+
+def test_signal_reversal_exits_at_close():
+    """An opposite signal closes the position at the candle close."""
+    close = np.full(10, 100.0)
+    close[4] = 100.3
+    result = _run(_make_df(_signal({1: 1, 4: -1}), close=close))
+
+    trade = result.trades[0]
+    assert trade.exit_price == 100.3
+    assert trade.metadata["exit_reason"] == "signal_reversal"
+    # No re-entry on the exit candle: the short opens on the next bar and is still open
+    assert result.num_trades == 1
+
+
+def test_equity_curve_tracks_unrealized_pnl():
+    """The equity curve has one point per bar and includes open positions."""
+    close = np.full(10, 100.0)
+    close[3] = 100.5
+    result = _run(_make_df(_signal({1: 1}), close=close))
+
+    assert len(result.equity_curve) == 10
+    assert result.equity_curve[1] == 10000.0
+    # Position of 100 units (1% risk / 1% stop) marked at 100.5
+    assert result.equity_curve[3] == pytest.approx(10050.0)
+
+
+def test_run_arrays_matches_backtest():
+    """run_arrays on raw columns gives the same result as backtest on the frame."""
+    high = np.full(10, 100.5)
+    high[4] = 102.5
+    df = _make_df(_signal({1: 1, 6: -1}), high=high)
+    config = BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0)
+    backtester = Backtester(config, RiskManagementConfig(risk_pct=0.01))
+
+    from_frame = backtester.backtest(df, _PresetSignalStrategy, None)
+    from_arrays = backtester.run_arrays(
+        df["open"].to_numpy(),
+        df["high"].to_numpy(),
+        df["low"].to_numpy(),
+        df["close"].to_numpy(),
+        df["signal"].to_numpy(),
+    )
+
+    assert from_arrays.equity_curve == from_frame.equity_curve
+    assert [t.pnl for t in from_arrays.trades] == [t.pnl for t in from_frame.trades]
+    assert from_arrays.trades[0].entry_time is None
+
+
+def test_kernel_sizing_matches_calculate_position_size_spot():
+    """The kernel's inlined sizing agrees with utils.risk.calculate_position_size_spot."""
+    rng = np.random.default_rng(5)
+    n = 400
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    high = np.maximum(open_, close) * 1.004
+    low = np.minimum(open_, close) * 0.996
+    signal = rng.choice(np.array([-1, 0, 0, 0, 1]), size=n)
+    strength = rng.uniform(0.2, 2.0, n)  # multipliers above 1 hit the capital cap
+    # initial_capital, sl_pct, tp_rr, fee_pct, risk_pct, allow_short
+    params = (10000.0, 0.01, 2.0, 0.0005, 0.01, True)
+
+    walk = _walk(open_, high, low, close, signal, strength, *params, np.empty(n))
+    _, entry_idx, _, _, entry_price, _, position_size, sl_price, _, pnl, _, n_trades, _ = walk
+
+    assert n_trades > 10
+    capital = 10000.0
+    for k in range(n_trades):
+        risk_pct = 0.01 * strength[entry_idx[k] - 1]
+        expected = calculate_position_size_spot(capital, entry_price[k], sl_price[k], risk_pct)
+        assert position_size[k] == expected
+        capital += pnl[k]
+
+
+def test_metrics_calculation():
+    """Drawdown and win/loss streaks are computed from the curve and trade PnLs."""
+    backtester = Backtester(BacktestConfig(initial_capital=100, sl_pct=0.01, tp_rr=2.0), None)
+
+    assert backtester._calculate_max_drawdown_from_curve([100, 120, 90, 130, 65]) == 50.0
+    assert backtester._calculate_max_drawdown_from_curve([100, 110, 120]) == 0.0
+
+    wins = np.array([1.0, 2.0, -1.0, 3.0, 1.0, 1.0, -2.0, -1.0]) > 0
+    assert Backtester._longest_run(wins) == 3
+    assert Backtester._longest_run(~wins) == 2
+    assert Backtester._longest_run(np.zeros(4, dtype=bool)) == 0
+
+
+def test_run_batch_matches_run_arrays():
+    """Each row of a batch gives the same result as a single run_arrays call."""
+    rng = np.random.default_rng(7)
+    n = 300
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    high = np.maximum(open_, close) * 1.004
+    low = np.minimum(open_, close) * 0.996
+    signals = rng.choice(np.array([-1, 0, 0, 0, 1]), size=(64, n))
+
+    config = BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0)
+    backtester = Backtester(config, RiskManagementConfig(risk_pct=0.01))
+    batch = backtester.run_batch(open_, high, low, close, signals)
+
+    assert len(batch) == 64
+    for row, result in zip(signals, batch):
+        single = backtester.run_arrays(open_, high, low, close, row)
+        assert result.equity_curve == single.equity_curve
+        assert [t.pnl for t in result.trades] == [t.pnl for t in single.trades]
+        # Trade columns are compact copies, not views into the batch buffers
+        assert result.trades.entry_price.base is None
+
+
+def test_run_batch_per_run_configs_match_run_arrays():
+    """Rows with their own config match run_arrays with that config."""
+    rng = np.random.default_rng(11)
+    n = 300
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    high = np.maximum(open_, close) * 1.004
+    low = np.minimum(open_, close) * 0.996
+    signals = rng.choice(np.array([-1, 0, 0, 0, 1]), size=(4, n))
+    signals[:] = signals[0]
+    configs = [
+        BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0),
+        BacktestConfig(initial_capital=5000, sl_pct=0.02, tp_rr=1.5, fee_pct=0.002),
+        BacktestConfig(initial_capital=10000, sl_pct=0.005, tp_rr=3.0, allow_short=False),
+        BacktestConfig(initial_capital=20000, sl_pct=0.015, tp_rr=1.0, fee_pct=0.0),
+    ]
+    risk = RiskManagementConfig(risk_pct=0.01)
+    batch = Backtester(configs[0], risk).run_batch(
+        open_, high, low, close, signals, configs=configs
+    )
+
+    for row, config, result in zip(signals, configs, batch):
+        single = Backtester(config, risk).run_arrays(open_, high, low, close, row)
+        assert result.equity_curve == single.equity_curve
+        assert [t.pnl for t in result.trades] == [t.pnl for t in single.trades]
+        assert result.total_return_pct == single.total_return_pct
+    # Same signals, different configs: every run actually used its own parameters
+    assert len({result.total_return_pct for result in batch}) == len(configs)
+
+    backtester = Backtester(configs[0], risk)
+    with pytest.raises(ValueError, match="configs"):
+        backtester.run_batch(open_, high, low, close, signals, configs=configs[:3])
+    with pytest.raises(ValueError, match="precision"):
+        f32 = BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0, precision="f32")
+        backtester.run_batch(open_, high, low, close, signals, configs=[f32] * 4)
+
+
+def test_float32_precision_matches_float64():
+    """precision="f32" gives the same trades as float64 up to float32 rounding."""
+    high = np.full(10, 100.5)
+    high[4] = 102.5
+    df = _make_df(_signal({1: 1, 6: -1}), high=high)
+    results = {}
+    for precision in ("f64", "f32"):
+        config = BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0, precision=precision)
+        backtester = Backtester(config, RiskManagementConfig(risk_pct=0.01))
+        results[precision] = backtester.backtest(df, _PresetSignalStrategy, None)
+
+    f64, f32 = results["f64"], results["f32"]
+    assert f32.num_trades == f64.num_trades
+    assert [t.metadata for t in f32.trades] == [t.metadata for t in f64.trades]
+    assert f32.equity_curve == pytest.approx(f64.equity_curve, rel=1e-6)
+
+
+_F32_WITHOUT_NUMBA_SCRIPT = textwrap.dedent(
+    """
+    import sys
+
+    sys.modules["numba"] = None  # makes utils._njit fall back to plain Python
+
+    import numpy as np
+    from backtesting.engine import BacktestConfig, Backtester
+    from utils._njit import NUMBA_AVAILABLE
+    from utils.risk import RiskManagementConfig, calculate_position_size_spot
+
+    assert not NUMBA_AVAILABLE
+    arrays = np.load(sys.argv[1])
+    config = BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0, precision="f32")
+    backtester = Backtester(config, RiskManagementConfig(risk_pct=0.01))
+    result = backtester.run_arrays(*(arrays[k] for k in ("open", "high", "low", "close", "signal")))
+    np.save(sys.argv[2], np.array(result.equity_curve))
+    """
+)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="compares against the numba-compiled kernel")
+def test_float32_without_numba_matches_compiled(tmp_path):
+    """The plain-Python fallback accumulates in float64 like the compiled kernel."""
+    rng = np.random.default_rng(3)
+    n = 2000
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    arrays = {
+        "open": open_,
+        "high": np.maximum(open_, close) * 1.004,
+        "low": np.minimum(open_, close) * 0.996,
+        "close": close,
+        "signal": rng.choice(np.array([-1, 0, 0, 0, 1]), size=n),
+    }
+    np.savez(tmp_path / "arrays.npz", **arrays)
+    script = tmp_path / "f32_without_numba.py"
+    script.write_text(_F32_WITHOUT_NUMBA_SCRIPT)
+    root = Path(__file__).resolve().parent.parent
+
+    subprocess.run(
+        [sys.executable, str(script), str(tmp_path / "arrays.npz"), str(tmp_path / "eq.npy")],
+        cwd=root,
+        env={**os.environ, "PYTHONPATH": str(root)},
+        check=True,
+        timeout=120,
+    )
+
+    config = BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0, precision="f32")
+    backtester = Backtester(config, RiskManagementConfig(risk_pct=0.01))
+    compiled = backtester.run_arrays(*arrays.values())
+    assert np.load(tmp_path / "eq.npy").tolist() == compiled.equity_curve
+
+
+def test_invalid_precision_rejected():
+    """Only "f64" and "f32" are accepted as precision."""
+    with pytest.raises(ValueError):
+        BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0, precision="f16")
+
+
+def test_trades_table_sequence_access():
+    """Trades are stored as columns and read back as TradeResult objects."""
+    high = np.full(10, 100.5)
+    high[4] = 102.5
+    low = np.full(10, 99.5)
+    low[7] = 97.5
+    result = _run(_make_df(_signal({1: 1, 5: -1}), high=high, low=low))
+    trades = result.trades
+
+    assert len(trades) == 2
+    assert trades.pnl.tolist() == [t.pnl for t in trades]
+    assert trades[-1].side == "short"
+    assert [t.side for t in trades[:2]] == ["long", "short"]
+    with pytest.raises(IndexError):
+        trades[2]
+
+
+@pytest.mark.parametrize("column", ["high", "low", "close", "signal", "signal_strength"])
+def test_run_arrays_rejects_length_mismatch(column):
+    """Arrays shorter than open_ raise instead of being read past their end."""
+    backtester = Backtester(BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0), None)
+    open_ = np.full(100, 100.0)
+    arrays = {
+        "high": open_ + 0.5,
+        "low": open_ - 0.5,
+        "close": open_,
+        "signal": _signal({1: 1}, n=100),
+        "signal_strength": np.ones(100),
+    }
+    arrays[column] = arrays[column][:10]
+
+    with pytest.raises(ValueError, match=column):
+        backtester.run_arrays(open_, **arrays)
+
+
+def test_nan_signal_rejected():
+    """NaN signals raise instead of being cast to an arbitrary int64."""
+    signal = _signal({1: 1}).astype(float)
+    signal[3] = np.nan
+
+    with pytest.raises(ValueError, match="NaN"):
+        _run(_make_df(signal))
+    backtester = Backtester(BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0), None)
+    prices = np.full(10, 100.0)
+    with pytest.raises(ValueError, match="NaN"):
+        backtester.run_batch(prices, prices, prices, prices, signal[None])
+
+
+def test_no_signal_result_has_empty_trades_table():
+    """The early return for frames without signals still exposes trade columns."""
+
+    class _NoSignalStrategy(_PresetSignalStrategy):
+        def generate_signals(self, df):
+            return df.drop(columns="signal")
+
+    backtester = Backtester(BacktestConfig(initial_capital=10000, sl_pct=0.01, tp_rr=2.0), None)
+    result = backtester.backtest(_make_df(_signal({1: 1})), _NoSignalStrategy, None)
+
+    assert len(result.trades) == 0
+    assert result.trades.pnl.size == 0
+    assert backtester.monte_carlo(result.trades) == {"final_equity": {}, "max_drawdown": {}}
+
+
+def test_monte_carlo_matches_per_simulation_loop():
+    """Blocked simulations give the same stats as shuffling one path at a time."""
+    backtester = Backtester(BacktestConfig(initial_capital=1000, sl_pct=0.01, tp_rr=2.0), None)
+    pnls = np.random.default_rng(1).normal(0, 25, 40)
+    idx = np.zeros(40, dtype=np.int64)
+    code = np.zeros(40, dtype=np.int8)
+    ones = np.ones(40)
+    trades = TradesTable(idx, idx, code, ones, ones, ones, ones, ones, pnls, code)
+    n_simulations = 100  # not a multiple of the block size
+
+    rng = np.random.default_rng(seed=42)
+    finals, drawdowns = [], []
+    for _ in range(n_simulations):
+        equity = 1000 + np.cumsum(rng.permutation(trades.pnl))
+        peak = np.maximum.accumulate(np.concatenate(([1000.0], equity)))[1:]
+        finals.append(equity[-1])
+        drawdowns.append(max(0.0, ((peak - equity) / peak * 100).max()))
+
+    result = backtester.monte_carlo(trades, n_simulations=n_simulations)
+
+    assert result["mean_final_equity"] == pytest.approx(round(np.mean(finals), 2))
+    assert result["mean_max_drawdown"] == pytest.approx(round(np.mean(drawdowns), 4))
+    assert result["max_drawdown"]["p95"] == pytest.approx(round(np.percentile(drawdowns, 95), 4))
@@ -0,0 +1,90 @@
+"""Tests that the numba indicator kernels match the pandas/ta implementations they replace."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import ta
+
+from strategies.bollinger_mean_reversion import _sma_std
+from strategies.keltner_breakout_strategy import KeltnerBreakoutStrategy, _atr_wilder
+from strategies.supertrend_strategy import _supertrend_loop
+
+
+@pytest.fixture(scope="module")
+def ohlc():
+    """Random-walk OHLC with isolated NaNs and a NaN gap longer than the windows."""
+    rng = np.random.default_rng(11)
+    n = 500
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    high = close * (1 + rng.uniform(0, 0.01, n))
+    low = close * (1 - rng.uniform(0, 0.01, n))
+    for values in (close, high, low):
+        values[rng.choice(n, 15, replace=False)] = np.nan
+    close[200:230] = np.nan
+    return pd.DataFrame({"high": high, "low": low, "close": close})
+
+
+def _assert_same(actual, expected):
+    expected = np.asarray(expected, dtype=np.float64)
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize("window,window_dev", [(20, 2.0), (5, 1.5)])
+def test_sma_std_matches_ta_bollinger_bands(ohlc, window, window_dev):
+    """mid +/- k * std equals ta's Bollinger bands, NaN positions included."""
+    bands = ta.volatility.BollingerBands(close=ohlc["close"], window=window, window_dev=window_dev)
+    mid, std = _sma_std(ohlc["close"].to_numpy(), window)
+
+    _assert_same(mid + window_dev * std, bands.bollinger_hband())
+    _assert_same(mid - window_dev * std, bands.bollinger_lband())
+
+
+@pytest.mark.parametrize("window", [14, 3])
+def test_atr_wilder_matches_pandas_atr(ohlc, window):
+    """The compiled ATR equals KeltnerBreakoutStrategy._atr, NaN positions included."""
+    expected = KeltnerBreakoutStrategy._atr(ohlc["high"], ohlc["low"], ohlc["close"], window)
+    actual = _atr_wilder(
+        ohlc["high"].to_numpy(), ohlc["low"].to_numpy(), ohlc["close"].to_numpy(), window
+    )
+
+    _assert_same(actual, expected)
+
+
+def _supertrend_reference(bu, bl, cl):
+    """The band/trend loop as it was written inline in SupertrendStrategy."""
+    n = len(cl)
+    fu = np.empty(n)
+    fl = np.empty(n)
+    tr = np.empty(n, dtype=np.int64)
+    st = np.empty(n)
+    fu[0], fl[0], tr[0], st[0] = bu[0], bl[0], 0, np.nan
+
+    for i in range(1, n):
+        fu[i] = bu[i] if (bu[i] < fu[i - 1] or cl[i - 1] > fu[i - 1]) else fu[i - 1]
+        fl[i] = bl[i] if (bl[i] > fl[i - 1] or cl[i - 1] < fl[i - 1]) else fl[i - 1]
+        if tr[i - 1] == 1:
+            tr[i] = -1 if cl[i] < fl[i] else 1
+        else:
+            tr[i] = 1 if cl[i] > fu[i] else -1
+        st[i] = fl[i] if tr[i] == 1 else fu[i]
+
+    return st, tr
+
+
+def test_supertrend_loop_matches_reference(ohlc):
+    """Supertrend values and trend direction are identical to the original loop."""
+    atr = ta.volatility.AverageTrueRange(
+        high=ohlc["high"], low=ohlc["low"], close=ohlc["close"], window=10
+    ).average_true_range()
+    hl2 = (ohlc["high"] + ohlc["low"]) / 2
+    bu = (hl2 + 3.0 * atr).to_numpy()
+    bl = (hl2 - 3.0 * atr).to_numpy()
+    cl = ohlc["close"].to_numpy()
+
+    st, tr = _supertrend_loop(bu, bl, cl)
+    expected_st, expected_tr = _supertrend_reference(bu, bl, cl)
+
+    np.testing.assert_array_equal(tr, expected_tr)
+    np.testing.assert_array_equal(st, expected_st)
+    assert set(np.unique(tr[1:])) == {-1, 1}
@@ -0,0 +1,54 @@
+"""Tests for the queue-based logger setup."""
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+_FORK_SCRIPT = textwrap.dedent(
+    """
+    import multiprocessing, os, sys
+    from utils.logger import get_logger
+
+    def work(i):
+        get_logger("worker").info("worker %d", i)
+
+    if __name__ == "__main__":
+        get_logger("parent").info("parent")
+        pid = os.fork()
+        if pid == 0:
+            get_logger("forked").info("forked child")
+            sys.exit(0)
+        os.waitpid(pid, 0)
+        ctx = multiprocessing.get_context("fork")
+        with ctx.Pool(2) as pool:
+            pool.map(work, range(2))
+        process = ctx.Process(target=work, args=(2,))
+        process.start()
+        process.join()
+    """
+)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_children_log_to_stdout(tmp_path):
+    """Records logged after fork() reach stdout, in plain and multiprocessing children."""
+    script = tmp_path / "fork_logging.py"
+    script.write_text(_FORK_SCRIPT)
+    root = Path(__file__).resolve().parent.parent
+
+    out = subprocess.run(
+        [sys.executable, str(script)],
+        cwd=root,
+        env={**os.environ, "PYTHONPATH": str(root)},
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    ).stdout
+
+    for message in ("parent", "forked child", "worker 0", "worker 1", "worker 2"):
+        assert f"INFO - {message}" in out
@@ -0,0 +1,26 @@
+"""Tests for position sizing helpers."""
+
+import numpy as np
+
+from utils.risk import calculate_position_size_spot, calculate_position_size_spot_batch
+
+
+def test_position_size_spot():
+    """Size risks risk_pct of capital on the stop, capped at what capital can buy."""
+    assert calculate_position_size_spot(10000, 100.0, 99.0, 0.01) == 100.0
+    assert calculate_position_size_spot(10000, 100.0, 99.9, 0.5) == 100.0
+    assert calculate_position_size_spot(10000, 100.0, 100.0, 0.01) == 0.0
+
+
+def test_position_size_spot_batch_matches_scalar():
+    """The vectorized version gives the same sizes as the scalar one."""
+    rng = np.random.default_rng(3)
+    capitals = rng.uniform(100, 10000, 200)
+    entries = rng.uniform(1, 200, 200)
+    stops = entries * rng.uniform(0.9, 1.1, 200)
+    stops[::10] = entries[::10]
+
+    batch = calculate_position_size_spot_batch(capitals, entries, stops, 0.02)
+    expected = [calculate_position_size_spot(*args, 0.02) for args in zip(capitals, entries, stops)]
+
+    assert batch.tolist() == expected
@@ -0,0 +1,27 @@
+"""Optional numba JIT support.
+
+``njit`` compiles the decorated function with numba when it is installed and
+is a no-op otherwise, so kernels written against plain NumPy arrays keep
+working without it. ``prange`` falls back to ``range`` the same way. Check
+``NUMBA_AVAILABLE`` when a vectorized pandas path is preferable to an
+uncompiled Python loop.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit, usable bare or with options."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -1,14 +1,100 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
+
+# All loggers enqueue records; a single background listener does the writes
+_log_queue = queue.SimpleQueue()
+_listener = None
+_setup_lock = threading.Lock()
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the asctime seconds part once per second."""
+
+    _cached_second = None
+    _cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+# Shared by every handler the listener owns
+_FORMATTER = _CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+def _start_listener() -> None:
+    global _listener
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_FORMATTER)
+    _listener = logging.handlers.QueueListener(
+        _log_queue, handler, respect_handler_level=True
+    )
+    _listener.start()
+    # Flush pending records on interpreter shutdown
+    atexit.register(_stop_listener, _listener)
+
+
+def _stop_listener(listener) -> None:
+    # Idempotent: may run from both atexit and multiprocessing's exit finalizers
+    global _listener
+    if _listener is listener:
+        _listener = None
+        listener.stop()
+
+
+def _restart_listener_in_child() -> None:
+    """The listener thread does not survive fork(); start one for the child."""
+    global _listener, _log_queue, _setup_lock
+    _setup_lock = threading.Lock()
+    if _listener is None:
+        return
+    _listener = None
+    # The inherited queue may be mid-get by the parent's listener; records still
+    # queued at fork time are written by the parent
+    _log_queue = queue.SimpleQueue()
+    _start_listener()
+    mp_util = sys.modules.get("multiprocessing.util")
+    if mp_util is not None:
+        # multiprocessing children leave through os._exit, which skips atexit, and
+        # clear exit finalizers after fork: register ours once that has happened
+        mp_util.register_after_fork(_listener, _register_exit_finalizer)
+
+
+def _register_exit_finalizer(listener) -> None:
+    sys.modules["multiprocessing.util"].Finalize(
+        None, _stop_listener, args=(listener,), exitpriority=0
+    )
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that follows ``_log_queue`` when a forked child replaces it."""
+
+    def enqueue(self, record):
+        _log_queue.put_nowait(record)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
+
 
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+    # Locked so concurrent first calls start a single listener (and atexit hook)
+    with _setup_lock:
+        if not logger.handlers:
+            if _listener is None:
+                _start_listener()
+            logger.addHandler(_QueueHandler(_log_queue))
+            logger.setLevel(logging.INFO)
     return logger
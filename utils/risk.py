@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import numpy as np
+
 @dataclass
 class RiskManagementConfig:
     risk_pct: float = 0.01
@@ -13,3 +15,14 @@ def calculate_position_size_spot(capital: float, entry: float, stop_loss: float,
     # Limitar al capital disponible
     max_position = capital / entry
     return min(position, max_position)
+
+def calculate_position_size_spot_batch(
+    capitals: np.ndarray, entries: np.ndarray, stops: np.ndarray, risk_pct
+) -> np.ndarray:
+    """Versión vectorizada de calculate_position_size_spot sobre arrays (0 si entry == stop)."""
+    capitals = np.asarray(capitals, dtype=np.float64)
+    entries = np.asarray(entries, dtype=np.float64)
+    price_diff = np.abs(entries - np.asarray(stops, dtype=np.float64))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        position = np.minimum(capitals * risk_pct / price_diff, capitals / entries)
+    return np.where(price_diff == 0, 0.0, position)